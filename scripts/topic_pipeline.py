@@ -233,6 +233,11 @@ def build_parser() -> argparse.ArgumentParser:
         help="用 DBLP title 回查 arXiv 並合併到 arxiv_metadata.json",
     )
     other.add_argument("--dblp-title-arxiv-max-results", type=_positive_int, default=10)
+    other.add_argument(
+        "--dblp-title-arxiv-no-cache",
+        action="store_true",
+        help="略過 arXiv 查詢/metadata 的 on-disk cache，一律重新打 API",
+    )
     other.add_argument("--force", action="store_true")
 
     criteria = add_subparser("criteria", help="（選用）產生 structured criteria JSON")
@@ -580,6 +585,7 @@ def main(argv: Optional[List[str]] = None) -> int:
                 ws,
                 max_results_per_title=args.dblp_title_arxiv_max_results,
                 request_pause=args.request_pause,
+                use_cache=not args.dblp_title_arxiv_no_cache,
                 force=args.force,
             )
             result.update(backfill_result)
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from src.pipelines.topic_pipeline import _drop_subsumed_terms, _flatten_search_terms
+
+
+def test_drop_subsumed_terms_removes_contained_phrases() -> None:
+    terms = [
+        "graph neural network",
+        "graph neural network survey",
+        "GNN",
+    ]
+    kept = _drop_subsumed_terms(terms)
+    assert "graph neural network" in kept
+    assert "graph neural network survey" not in kept
+    assert "GNN" in kept
+
+
+def test_drop_subsumed_terms_keeps_single_tokens() -> None:
+    kept = _drop_subsumed_terms(["GNN", "GNN survey"])
+    assert kept == ["GNN"]
+
+
+def test_drop_subsumed_terms_keeps_reordered_phrases() -> None:
+    # Token overlap without contiguous containment is a different phrase
+    # query, so neither term subsumes the other.
+    kept = _drop_subsumed_terms(["audio codec", "codec benchmark audio"])
+    assert kept == ["audio codec", "codec benchmark audio"]
+
+
+def test_flatten_search_terms_caps_and_dedupes() -> None:
+    flattened = _flatten_search_terms(
+        {
+            "core": ["speech tokenizer", "speech tokenizer", "audio codec"],
+            "extra": ["speech tokenizer benchmark"],
+        },
+        max_terms_per_category=2,
+    )
+    # "speech tokenizer benchmark" is phrase-subsumed by "speech tokenizer";
+    # "audio codec" falls outside the per-category cap.
+    assert flattened == ["speech tokenizer"]